@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Library Management System - Search Indexes
+
+from bisect import bisect_left, insort
+
+
+class PrefixIndex:
+    """Maps string keys to values and finds every value whose key starts with a prefix."""
+
+    def __init__(self, entries=()):
+        """Initialize the index from (key, value) pairs."""
+        # Kept sorted so all keys sharing a prefix are contiguous
+        self._entries = sorted(entries)
+
+    def add(self, key, value):
+        """Add a (key, value) pair to the index."""
+        insort(self._entries, (key, value))
+
+    def remove(self, key, value):
+        """Remove a (key, value) pair from the index if present."""
+        i = bisect_left(self._entries, (key, value))
+        if i < len(self._entries) and self._entries[i] == (key, value):
+            del self._entries[i]
+
+    def search(self, prefix):
+        """Yield the values of all keys starting with prefix, in key order."""
+        entries = self._entries
+        for i in range(bisect_left(entries, (prefix,)), len(entries)):
+            key, value = entries[i]
+            if not key.startswith(prefix):
+                break
+            yield value
+
+
+def _trigrams(text):
+    """Return the set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Maps values to the trigrams of their text to narrow substring searches."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings = {}
+        self._trigrams = {}
+
+    def add(self, value, text):
+        """Index value under the trigrams of text, replacing any previous text."""
+        new = _trigrams(text)
+        old = self._trigrams.get(value, set())
+        for trigram in old - new:
+            self._discard(trigram, value)
+        for trigram in new - old:
+            self._postings.setdefault(trigram, set()).add(value)
+        self._trigrams[value] = new
+
+    def remove(self, value):
+        """Remove value from the index if present."""
+        for trigram in self._trigrams.pop(value, ()):
+            self._discard(trigram, value)
+
+    def _discard(self, trigram, value):
+        """Remove value from one posting set, dropping the set once empty."""
+        posting = self._postings[trigram]
+        posting.discard(value)
+        if not posting:
+            del self._postings[trigram]
+
+    def candidates(self, query):
+        """Return the unordered set of values whose text may contain query, or None if query is too short to narrow."""
+        trigrams = _trigrams(query)
+        if not trigrams:
+            return None
+
+        postings = [self._postings.get(trigram) for trigram in trigrams]
+        if not all(postings):
+            return set()
+
+        # Intersect starting from the smallest set to keep the work proportional to it
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
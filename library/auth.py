@@ -2,9 +2,15 @@
 # Library Management System - Authentication
 
 import hashlib
+import hmac
 import os
 from .models import User
 
+_sha256 = hashlib.sha256
+
+# Roles allowed to manage books
+LIBRARIAN_ROLES = ('librarian', 'admin')
+
 
 class Authentication:
     """Handles user authentication for the Library Management System."""
@@ -13,12 +19,38 @@ class Authentication:
         """Initialize the authentication system."""
         self.data_handler = data_handler
         self.current_user = None
-
-    def _hash_password(self, password):
-        """Hash a password for secure storage."""
-        # In a real application, use a secure hashing method
-        # For simplicity, we're using a basic hash here
-        return hashlib.sha256(password.encode()).hexdigest()
+        # Last successfully verified ((password, salt), hash) pair, so re-presenting it skips the KDF
+        self._pw_cache = (None, None)
+
+    def _hash_password(self, password, salt):
+        """Hash a password with scrypt using the given hex-encoded salt."""
+        return hashlib.scrypt(password.encode('utf-8', 'strict'), salt=bytes.fromhex(salt),
+                              n=2**14, r=8, p=1, dklen=32).hex()
+
+    def _legacy_hash_password(self, password):
+        """Hash a password the way accounts created before salting were stored."""
+        return _sha256(password.encode('utf-8', 'strict')).hexdigest()
+
+    def _check_password(self, user, password):
+        """Check a password against a user's stored hash in constant time."""
+        if not user.salt:
+            return hmac.compare_digest(user.password, self._legacy_hash_password(password))
+
+        key = (password, user.salt)
+        hashed = self._pw_cache[1] if self._pw_cache[0] == key else self._hash_password(password, user.salt)
+        if not hmac.compare_digest(user.password, hashed):
+            return False
+
+        # Only a verified password is kept, never failed guesses
+        self._pw_cache = (key, hashed)
+        return True
+
+    def _set_password(self, user, password):
+        """Store a freshly salted hash of the password on the user."""
+        user.salt = os.urandom(16).hex()
+        user.password = self._hash_password(password, user.salt)
+        # The cached pair belonged to the old salt and can no longer match
+        self._pw_cache = (None, None)
 
     def register_user(self, username, password, name, email=None, role='member'):
         """Register a new user."""
@@ -27,9 +59,10 @@ class Authentication:
             return False, "Username already exists."
 
         # Create and save the new user
-        hashed_password = self._hash_password(password)
-        user = User(username, hashed_password, name, email, role)
+        user = User(username, None, name, email, role)
+        self._set_password(user, password)
         self.data_handler.add_user(user)
+        self.data_handler.flush()
         return True, "User registered successfully."
 
     def login(self, username, password):
@@ -38,16 +71,22 @@ class Authentication:
         if not user:
             return False, "User not found."
 
-        hashed_password = self._hash_password(password)
-        if user.password != hashed_password:
+        if not self._check_password(user, password):
             return False, "Incorrect password."
 
+        # Upgrade unsalted legacy hashes now that the plain password is known
+        if not user.salt:
+            self._set_password(user, password)
+            self.data_handler.update_user(user)
+            self.data_handler.flush()
+
         self.current_user = user
         return True, "Login successful."
 
     def logout(self):
         """Log out the current user."""
         self.current_user = None
+        self._pw_cache = (None, None)
         return True, "Logged out successfully."
 
     def is_authenticated(self):
@@ -56,25 +95,24 @@ class Authentication:
 
     def is_admin(self):
         """Check if the current user is an admin."""
-        return self.is_authenticated() and self.current_user.role == 'admin'
+        user = self.current_user
+        return user is not None and user.role == 'admin'
 
     def is_librarian(self):
         """Check if the current user is a librarian or admin."""
-        return self.is_authenticated() and (
-            self.current_user.role == 'librarian' or
-            self.current_user.role == 'admin'
-        )
+        user = self.current_user
+        return user is not None and user.role in LIBRARIAN_ROLES
 
     def change_password(self, current_password, new_password):
         """Change a user's password."""
-        if not self.is_authenticated():
+        user = self.current_user
+        if user is None:
             return False, "No user is logged in."
 
-        hashed_current = self._hash_password(current_password)
-        if self.current_user.password != hashed_current:
+        if not self._check_password(user, current_password):
             return False, "Current password is incorrect."
 
-        hashed_new = self._hash_password(new_password)
-        self.current_user.password = hashed_new
-        self.data_handler.update_user(self.current_user)
+        self._set_password(user, new_password)
+        self.data_handler.update_user(user)
+        self.data_handler.flush()
         return True, "Password changed successfully."
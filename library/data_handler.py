@@ -1,10 +1,57 @@
 #!/usr/bin/env python3
 # Library Management System - Data Handler
 
+import atexit
 import json
 import os
+import time
+from bisect import bisect_left, insort
 from datetime import datetime
 from .models import Book, User, Transaction
+from ._index import PrefixIndex, TrigramIndex
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(raw):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data):
+    """Serialize data to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+# Transactions are split across one file per leading hex digit of their ID
+_SHARD_KEYS = "0123456789abcdef"
+
+# Position of each searchable field in the cached book text tuples
+_SEARCH_FIELDS = {'title': 0, 'author': 1, 'isbn': 2, 'all': 3}
+
+
+def _book_text(book_data):
+    """Return the lower-cased (title, author, isbn, all fields) search text of a book."""
+    title, author, isbn = book_data['title'].lower(), book_data['author'].lower(), book_data['isbn'].lower()
+    # NUL separators keep a query from matching across field boundaries
+    return title, author, isbn, f"{title}\0{author}\0{isbn}"
+
+
+def _is_active(transaction_data):
+    """Check if a transaction record is an issue that has not been returned."""
+    return transaction_data['transaction_type'] == 'issue' and not transaction_data['return_date']
+
+
+def normalize_isbn(isbn):
+    """Normalize an ISBN for storage and exact-match lookups."""
+    return isbn.strip().upper()
 
 
 class DataHandler:
@@ -15,188 +62,451 @@ class DataHandler:
         self.data_dir = data_dir
         self.books_file = os.path.join(data_dir, "books.json")
         self.users_file = os.path.join(data_dir, "users.json")
-        self.transactions_file = os.path.join(data_dir, "transactions.json")
+        self.transactions_dir = os.path.join(data_dir, "transactions")
+        self.transaction_shards = [os.path.join(self.transactions_dir, f"{key}.json") for key in _SHARD_KEYS]
+
+        # Parsed records ({id: record}), keyed by path and validated against the file's mtime
+        self._cache = {}
+        self._mtime = {}
+
+        # All transactions merged from the shard files, rebuilt when any shard is reloaded
+        self._transactions = {}
+        self._transaction_shard_data = ()
+        # Sequence number for the next added transaction, stored as 'seq' to restore insertion order on reload
+        self._next_transaction_seq = 0
+
+        # Secondary lookup indexes built from the cached records
+        self._by_username = {}
+        self._by_isbn = {}
+        self._book_text = {}  # book id -> lower-cased (title, author, isbn, all fields)
+        self._book_order = {}  # book id -> catalogue position, increasing in insertion order
+        self._next_book_order = 0
+        self._book_prefixes = PrefixIndex()  # lower-cased title/author -> book id
+        self._book_trigrams = TrigramIndex()  # trigrams of the all-fields text -> book ids
+        self._open_loans = {}  # transaction id -> due timestamp of issues not yet returned
+        self._loans_by_due = []  # sorted (due timestamp, transaction id) of the same issues
+        self._transactions_by_user = {}  # user id -> {transaction id: None}, in insertion order
+        self._transactions_by_book = {}  # book id -> {transaction id: None}, in insertion order
+        self._active_by_user_book = {}  # (user id, book id) -> id of the open issue
+
+        # Files with in-memory changes that have not been written yet
+        self._dirty = set()
 
-        # Create the data directory if it doesn't exist
-        os.makedirs(data_dir, exist_ok=True)
+        # Models returned by find_*_by_id, valid while the data version is unchanged
+        self._version = 0
+        self._lookup_cache = {}
+        self._lookup_version = 0
+        atexit.register(self.flush)
 
-        # Create empty files if they don't exist
-        for file_path in [self.books_file, self.users_file, self.transactions_file]:
+        # Create the data directories if they don't exist
+        os.makedirs(self.transactions_dir, exist_ok=True)
+
+        # Create empty files if they don't exist; missing shards are simply empty
+        for file_path in [self.books_file, self.users_file]:
             if not os.path.exists(file_path):
                 with open(file_path, 'w') as f:
                     json.dump([], f)
 
+        # Move transactions from the single file used by earlier versions into shards
+        legacy_transactions_file = os.path.join(data_dir, "transactions.json")
+        if os.path.exists(legacy_transactions_file):
+            self._migrate_transactions(legacy_transactions_file)
+
     def _read_data(self, file_path):
-        """Read data from a JSON file."""
+        """Read records from a JSON file as a dict keyed by ID, reusing the cached copy if the file is unchanged."""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            mtime = os.stat(file_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        # Unflushed changes take precedence over the file on disk
+        if file_path in self._dirty:
+            return self._cache[file_path]
+
+        if file_path in self._cache and self._mtime.get(file_path) == mtime:
+            return self._cache[file_path]
+
+        try:
+            with open(file_path, 'rb') as f:
+                records = _json_loads(f.read())
         except (json.JSONDecodeError, FileNotFoundError):
-            return []
+            records = []
+
+        data = {record['id']: record for record in records}
+        self._cache[file_path] = data
+        self._mtime[file_path] = mtime
+        self._version += 1
+        self._build_indexes(file_path, data)
+        return data
 
     def _write_data(self, file_path, data):
-        """Write data to a JSON file."""
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Write records to a JSON file as an array and refresh the cached copy."""
+        # Write a sibling temp file and swap it in, so readers never see a partial file
+        temp_path = file_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(_json_dumps(list(data.values())))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._cache[file_path] = data
+        self._mtime[file_path] = os.stat(file_path).st_mtime_ns
+
+    def _mark_dirty(self, file_path):
+        """Record that a file has unwritten changes and invalidate memoized lookups."""
+        self._dirty.add(file_path)
+        self._version += 1
+
+    def _find_model(self, file_path, model, record_id):
+        """Find a record by ID as a model object, reusing the object from an earlier lookup if nothing has changed."""
+        data = self._read_data(file_path)
+        if self._lookup_version != self._version:
+            self._lookup_cache.clear()
+            self._lookup_version = self._version
+
+        key = (file_path, record_id)
+        if key not in self._lookup_cache:
+            record = data.get(record_id)
+            self._lookup_cache[key] = model.from_dict(record) if record else None
+        return self._lookup_cache[key]
+
+    def flush(self):
+        """Write all pending changes to disk."""
+        for file_path in sorted(self._dirty):
+            self._write_data(file_path, self._cache[file_path])
+        self._dirty.clear()
+
+    def _shard_path(self, transaction_id):
+        """Return the shard file that stores a transaction."""
+        key = transaction_id[:1].lower()
+        if key not in _SHARD_KEYS:
+            key = _SHARD_KEYS[0]
+        return os.path.join(self.transactions_dir, f"{key}.json")
+
+    def _read_transactions(self):
+        """Read all transactions as one dict keyed by ID, merging the shard files."""
+        shards = tuple(self._read_data(file_path) for file_path in self.transaction_shards)
+
+        # _read_data returns the same dict objects until a shard is reloaded from disk
+        if len(shards) != len(self._transaction_shard_data) or any(
+                shard is not cached for shard, cached in zip(shards, self._transaction_shard_data)):
+            records = [record for shard in shards for record in shard.values()]
+            # Restore insertion order; records saved before 'seq' existed come first, by date
+            records.sort(key=lambda record: (record.get('seq', -1), record['transaction_date']))
+            self._next_transaction_seq = max((record.get('seq', -1) for record in records), default=-1) + 1
+            self._transactions = {record['id']: record for record in records}
+            self._transaction_shard_data = shards
+            self._build_transaction_indexes(self._transactions)
+        return self._transactions
+
+    def _migrate_transactions(self, legacy_file):
+        """Move transactions from a single JSON file into shard files."""
+        with open(legacy_file, 'rb') as f:
+            raw = f.read()
+
+        # An empty file, as a crash mid-write could leave, simply has no records
+        records = []
+        if raw.strip():
+            try:
+                records = _json_loads(raw)
+            except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
+                # Set the unreadable file aside for manual recovery rather than losing it
+                corrupt_file = legacy_file + '.corrupt'
+                os.replace(legacy_file, corrupt_file)
+                print(f"Warning: could not parse {legacy_file}; moved it to {corrupt_file}. "
+                      "Starting without its transactions.")
+                return
+
+        for seq, record in enumerate(records):
+            # The legacy file is in insertion order, so number the records as they appear
+            record['seq'] = seq
+            shard_path = self._shard_path(record['id'])
+            self._read_data(shard_path)[record['id']] = record
+            self._mark_dirty(shard_path)
+        self.flush()
+
+        # Keep the original as a backup only once its records are safely in the shards
+        os.replace(legacy_file, legacy_file + '.bak')
+
+    def _build_indexes(self, file_path, data):
+        """Build the secondary lookup indexes for freshly loaded records."""
+        if file_path == self.books_file:
+            self._by_isbn = {normalize_isbn(record['isbn']): record for record in data.values()}
+            self._book_text = {record['id']: _book_text(record) for record in data.values()}
+            self._book_order = {book_id: i for i, book_id in enumerate(data)}
+            self._next_book_order = len(data)
+            self._book_prefixes = PrefixIndex(
+                (key, book_id) for book_id, text in self._book_text.items() for key in text[:2])
+            self._book_trigrams = TrigramIndex()
+            for book_id, text in self._book_text.items():
+                self._book_trigrams.add(book_id, text[3])
+        elif file_path == self.users_file:
+            self._by_username = {record['username'].lower(): record for record in data.values()}
+
+    def _build_transaction_indexes(self, data):
+        """Build the transaction lookup indexes for freshly merged records."""
+        self._open_loans = {}
+        self._transactions_by_user = {}
+        self._transactions_by_book = {}
+        self._active_by_user_book = {}
+        for record in data.values():
+            self._transactions_by_user.setdefault(record['user_id'], {})[record['id']] = None
+            self._transactions_by_book.setdefault(record['book_id'], {})[record['id']] = None
+            if _is_active(record):
+                self._active_by_user_book.setdefault((record['user_id'], record['book_id']), record['id'])
+            due_ts = self._open_loan_due(record)
+            if due_ts is not None:
+                self._open_loans[record['id']] = due_ts
+        self._loans_by_due = sorted((due_ts, transaction_id)
+                                    for transaction_id, due_ts in self._open_loans.items())
+
+    def _index_book_text(self, book_data):
+        """Cache the lower-cased searchable fields of a book and index its title and author prefixes."""
+        book_id = book_data['id']
+        self._unindex_book_prefixes(book_id)
+        self._book_text[book_id] = text = _book_text(book_data)
+        if book_id not in self._book_order:
+            self._book_order[book_id] = self._next_book_order
+            self._next_book_order += 1
+        for key in text[:2]:
+            self._book_prefixes.add(key, book_id)
+        self._book_trigrams.add(book_id, text[3])
+
+    def _unindex_book_prefixes(self, book_id):
+        """Remove a book's title and author from the prefix index."""
+        for key in self._book_text.get(book_id, ())[:2]:
+            self._book_prefixes.remove(key, book_id)
+
+    def _index_transaction(self, transaction_data, old_data=None):
+        """Update the transaction indexes after a record is added or replaced."""
+        transaction_id = transaction_data['id']
+        for index, key in ((self._transactions_by_user, 'user_id'), (self._transactions_by_book, 'book_id')):
+            if old_data and old_data[key] != transaction_data[key]:
+                index[old_data[key]].pop(transaction_id, None)
+            index.setdefault(transaction_data[key], {})[transaction_id] = None
+
+        if old_data:
+            old_key = (old_data['user_id'], old_data['book_id'])
+            if self._active_by_user_book.get(old_key) == transaction_id:
+                del self._active_by_user_book[old_key]
+        if _is_active(transaction_data):
+            self._active_by_user_book.setdefault(
+                (transaction_data['user_id'], transaction_data['book_id']), transaction_id)
+
+        self._index_open_loan(transaction_data)
+
+    def _open_loan_due(self, transaction_data):
+        """Return the due timestamp of an open issue, or None if the transaction is not one."""
+        if _is_active(transaction_data) and transaction_data['due_date']:
+            due_ts = transaction_data.get('due_ts')
+            if due_ts is None:
+                # Records written before timestamps were stored
+                due_ts = int(datetime.strptime(transaction_data['due_date'], "%Y-%m-%d %H:%M:%S").timestamp())
+            return due_ts
+        return None
+
+    def _index_open_loan(self, transaction_data):
+        """Track the due timestamp of a transaction while it is an open issue."""
+        transaction_id = transaction_data['id']
+        old_due_ts = self._open_loans.pop(transaction_id, None)
+        if old_due_ts is not None:
+            del self._loans_by_due[bisect_left(self._loans_by_due, (old_due_ts, transaction_id))]
+
+        due_ts = self._open_loan_due(transaction_data)
+        if due_ts is not None:
+            self._open_loans[transaction_id] = due_ts
+            insort(self._loans_by_due, (due_ts, transaction_id))
 
     # Book operations
     def get_all_books(self):
         """Get all books from the data store."""
         books_data = self._read_data(self.books_file)
-        return [Book.from_dict(book_data) for book_data in books_data]
+        return [Book.from_dict(book_data) for book_data in books_data.values()]
 
     def add_book(self, book):
         """Add a new book to the data store."""
         books_data = self._read_data(self.books_file)
-        books_data.append(book.to_dict())
-        self._write_data(self.books_file, books_data)
+        books_data[book.id] = self._by_isbn[normalize_isbn(book.isbn)] = book_data = book.to_dict()
+        self._index_book_text(book_data)
+        self._mark_dirty(self.books_file)
 
     def update_book(self, book):
         """Update an existing book in the data store."""
         books_data = self._read_data(self.books_file)
-        for i, book_data in enumerate(books_data):
-            if book_data['id'] == book.id:
-                books_data[i] = book.to_dict()
-                break
-        self._write_data(self.books_file, books_data)
+        if book.id in books_data:
+            self._by_isbn.pop(normalize_isbn(books_data[book.id]['isbn']), None)
+            books_data[book.id] = self._by_isbn[normalize_isbn(book.isbn)] = book_data = book.to_dict()
+            self._index_book_text(book_data)
+            self._mark_dirty(self.books_file)
 
     def delete_book(self, book_id):
         """Delete a book from the data store."""
         books_data = self._read_data(self.books_file)
-        books_data = [book_data for book_data in books_data if book_data['id'] != book_id]
-        self._write_data(self.books_file, books_data)
+        book_data = books_data.pop(book_id, None)
+        if book_data:
+            self._by_isbn.pop(normalize_isbn(book_data['isbn']), None)
+            self._unindex_book_prefixes(book_id)
+            self._book_trigrams.remove(book_id)
+            self._book_text.pop(book_id, None)
+            self._book_order.pop(book_id, None)
+            self._mark_dirty(self.books_file)
 
     def find_book_by_id(self, book_id):
-        """Find a book by its ID."""
-        books_data = self._read_data(self.books_file)
-        for book_data in books_data:
-            if book_data['id'] == book_id:
-                return Book.from_dict(book_data)
-        return None
+        """Find a book by its ID.
+
+        The returned object is shared with other lookups until the data changes,
+        so save any modification with update_book.
+        """
+        return self._find_model(self.books_file, Book, book_id)
+
+    def find_book_by_isbn(self, isbn):
+        """Find a book by its exact ISBN."""
+        self._read_data(self.books_file)
+        book_data = self._by_isbn.get(normalize_isbn(isbn))
+        return Book.from_dict(book_data) if book_data else None
 
     def search_books(self, query, field=None):
         """Search for books by title, author, or ISBN."""
-        books = self.get_all_books()
+        books_data = self._read_data(self.books_file)
         query = query.lower()
 
-        if not field:
-            # Search in all fields
-            return [book for book in books if
-                    query in book.title.lower() or
-                    query in book.author.lower() or
-                    query in book.isbn.lower()]
-        elif field == 'title':
-            return [book for book in books if query in book.title.lower()]
-        elif field == 'author':
-            return [book for book in books if query in book.author.lower()]
-        elif field == 'isbn':
-            return [book for book in books if query in book.isbn.lower()]
-        else:
+        # Match against the pre-lowered fields and only build Book objects for matches
+        # Search in all fields when none is given
+        position = _SEARCH_FIELDS.get(field) if field else _SEARCH_FIELDS['all']
+        if position is None:
             return []
 
+        # Every field is part of the all-fields text, so its trigram candidates cover any field;
+        # queries shorter than a trigram fall back to checking every book
+        book_ids = self._book_trigrams.candidates(query)
+        if book_ids is None:
+            book_ids = self._book_text
+        else:
+            # Candidates are unordered; results are numbered by position, so keep catalogue order
+            book_ids = sorted(book_ids, key=self._book_order.__getitem__)
+        return [Book.from_dict(books_data[book_id]) for book_id in book_ids
+                if query in self._book_text[book_id][position]]
+
+    def search_books_prefix(self, prefix):
+        """Search for books whose title or author starts with prefix."""
+        books_data = self._read_data(self.books_file)
+        # dict.fromkeys drops books matching on both title and author, keeping order
+        book_ids = dict.fromkeys(self._book_prefixes.search(prefix.lower()))
+        return [Book.from_dict(books_data[book_id]) for book_id in book_ids]
+
     # User operations
     def get_all_users(self):
         """Get all users from the data store."""
         users_data = self._read_data(self.users_file)
-        return [User.from_dict(user_data) for user_data in users_data]
+        return [User.from_dict(user_data) for user_data in users_data.values()]
 
     def add_user(self, user):
         """Add a new user to the data store."""
         users_data = self._read_data(self.users_file)
-        users_data.append(user.to_dict())
-        self._write_data(self.users_file, users_data)
+        users_data[user.id] = self._by_username[user.username.lower()] = user.to_dict()
+        self._mark_dirty(self.users_file)
 
     def update_user(self, user):
         """Update an existing user in the data store."""
         users_data = self._read_data(self.users_file)
-        for i, user_data in enumerate(users_data):
-            if user_data['id'] == user.id:
-                users_data[i] = user.to_dict()
-                break
-        self._write_data(self.users_file, users_data)
+        if user.id in users_data:
+            self._by_username.pop(users_data[user.id]['username'].lower(), None)
+            users_data[user.id] = self._by_username[user.username.lower()] = user.to_dict()
+            self._mark_dirty(self.users_file)
 
     def delete_user(self, user_id):
         """Delete a user from the data store."""
         users_data = self._read_data(self.users_file)
-        users_data = [user_data for user_data in users_data if user_data['id'] != user_id]
-        self._write_data(self.users_file, users_data)
+        user_data = users_data.pop(user_id, None)
+        if user_data:
+            self._by_username.pop(user_data['username'].lower(), None)
+            self._mark_dirty(self.users_file)
 
     def find_user_by_id(self, user_id):
-        """Find a user by ID."""
-        users_data = self._read_data(self.users_file)
-        for user_data in users_data:
-            if user_data['id'] == user_id:
-                return User.from_dict(user_data)
-        return None
+        """Find a user by ID.
+
+        The returned object is shared with other lookups until the data changes,
+        so save any modification with update_user.
+        """
+        return self._find_model(self.users_file, User, user_id)
 
     def find_user_by_username(self, username):
         """Find a user by username."""
-        users_data = self._read_data(self.users_file)
-        for user_data in users_data:
-            if user_data['username'].lower() == username.lower():
-                return User.from_dict(user_data)
-        return None
+        self._read_data(self.users_file)
+        user_data = self._by_username.get(username.lower())
+        return User.from_dict(user_data) if user_data else None
 
     # Transaction operations
     def get_all_transactions(self):
         """Get all transactions from the data store."""
-        transactions_data = self._read_data(self.transactions_file)
-        return [Transaction.from_dict(transaction_data) for transaction_data in transactions_data]
+        return list(self.iter_transactions())
+
+    def iter_transactions(self):
+        """Yield transactions one at a time, building each only when it is consumed."""
+        for transaction_data in list(self._read_transactions().values()):
+            yield Transaction.from_dict(transaction_data)
 
     def add_transaction(self, transaction):
         """Add a new transaction to the data store."""
-        transactions_data = self._read_data(self.transactions_file)
-        transactions_data.append(transaction.to_dict())
-        self._write_data(self.transactions_file, transactions_data)
+        transactions_data = self._read_transactions()
+        shard_path = self._shard_path(transaction.id)
+        transactions_data[transaction.id] = transaction_data = transaction.to_dict()
+        transaction_data['seq'] = self._next_transaction_seq
+        self._next_transaction_seq += 1
+        self._cache[shard_path][transaction.id] = transaction_data
+        self._index_transaction(transaction_data)
+        self._mark_dirty(shard_path)
 
     def update_transaction(self, transaction):
         """Update an existing transaction in the data store."""
-        transactions_data = self._read_data(self.transactions_file)
-        for i, transaction_data in enumerate(transactions_data):
-            if transaction_data['id'] == transaction.id:
-                transactions_data[i] = transaction.to_dict()
-                break
-        self._write_data(self.transactions_file, transactions_data)
+        transactions_data = self._read_transactions()
+        if transaction.id in transactions_data:
+            shard_path = self._shard_path(transaction.id)
+            old_data = transactions_data[transaction.id]
+            transactions_data[transaction.id] = transaction_data = transaction.to_dict()
+            if 'seq' in old_data:
+                transaction_data['seq'] = old_data['seq']
+            self._cache[shard_path][transaction.id] = transaction_data
+            self._index_transaction(transaction_data, old_data)
+            self._mark_dirty(shard_path)
 
     def find_transaction_by_id(self, transaction_id):
         """Find a transaction by ID."""
-        transactions_data = self._read_data(self.transactions_file)
-        for transaction_data in transactions_data:
-            if transaction_data['id'] == transaction_id:
-                return Transaction.from_dict(transaction_data)
-        return None
+        transaction_data = self._read_transactions().get(transaction_id)
+        return Transaction.from_dict(transaction_data) if transaction_data else None
 
     def get_user_transactions(self, user_id, active_only=False):
         """Get all transactions for a specific user."""
-        transactions = self.get_all_transactions()
-        if active_only:
-            return [t for t in transactions if t.user_id == user_id and t.transaction_type == 'issue' and not t.return_date]
-        return [t for t in transactions if t.user_id == user_id]
+        return self._get_indexed_transactions('_transactions_by_user', user_id, active_only)
 
     def get_book_transactions(self, book_id, active_only=False):
         """Get all transactions for a specific book."""
-        transactions = self.get_all_transactions()
-        if active_only:
-            return [t for t in transactions if t.book_id == book_id and t.transaction_type == 'issue' and not t.return_date]
-        return [t for t in transactions if t.book_id == book_id]
+        return self._get_indexed_transactions('_transactions_by_book', book_id, active_only)
+
+    def _get_indexed_transactions(self, index_name, key, active_only):
+        """Get the transactions listed under key in the named user or book index."""
+        # Read first: reloading a shard rebuilds the index
+        transactions_data = self._read_transactions()
+        index = getattr(self, index_name)
+        records = (transactions_data[transaction_id] for transaction_id in index.get(key, ()))
+        return [Transaction.from_dict(d) for d in records if not active_only or _is_active(d)]
 
-    def get_overdue_transactions(self):
+    def find_active_transaction(self, user_id, book_id):
+        """Find the open issue of a book to a user, if any."""
+        transactions_data = self._read_transactions()
+        transaction_id = self._active_by_user_book.get((user_id, book_id))
+        return Transaction.from_dict(transactions_data[transaction_id]) if transaction_id else None
+
+    def get_overdue_transactions(self, now=None):
         """Get all overdue transactions."""
-        transactions = self.get_all_transactions()
-        today = datetime.now()
-        overdue = []
-
-        for t in transactions:
-            if (t.transaction_type == 'issue' and
-                not t.return_date and
-                t.due_date):
-
-                # Compare dates
-                if isinstance(t.due_date, str):
-                    due_date = datetime.strptime(t.due_date, "%Y-%m-%d %H:%M:%S")
-                    if today > due_date:
-                        overdue.append(t)
-                elif today > t.due_date:
-                    overdue.append(t)
-
-        return overdue
+        transactions_data = self._read_transactions()
+        now_ts = now.timestamp() if now else time.time()
+
+        # Open issues are sorted by due timestamp, so the overdue ones form a prefix
+        end = bisect_left(self._loans_by_due, (now_ts,))
+        return [Transaction.from_dict(transactions_data[transaction_id])
+                for _, transaction_id in self._loans_by_due[:end]]
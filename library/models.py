@@ -5,11 +5,25 @@ from datetime import datetime, timedelta
 import uuid
 
 
+def _timestamp(value):
+    """Convert a datetime to whole epoch seconds for storage."""
+    return int(value.timestamp()) if value else None
+
+
+def _stored_datetime(data, field, ts_field):
+    """Read a stored datetime, preferring its epoch-seconds copy over parsing the string."""
+    if data.get(ts_field) is not None:
+        return datetime.fromtimestamp(data[ts_field])
+    if data.get(field):
+        return datetime.strptime(data[field], "%Y-%m-%d %H:%M:%S")
+    return None
+
+
 class Book:
     """Represents a book in the library."""
 
     def __init__(self, title, author, isbn, publisher=None, year=None, copies=1):
-        self.id = str(uuid.uuid4())
+        self.id = uuid.uuid4().hex
         self.title = title
         self.author = author
         self.isbn = isbn
@@ -37,15 +51,15 @@ class Book:
     @classmethod
     def from_dict(cls, data):
         """Create a Book instance from dictionary data."""
-        book = cls(
-            title=data['title'],
-            author=data['author'],
-            isbn=data['isbn'],
-            publisher=data.get('publisher'),
-            year=data.get('year'),
-            copies=data.get('total_copies', 1)
-        )
+        # Bypass __init__ so no throwaway ID is generated for stored records
+        book = cls.__new__(cls)
         book.id = data['id']
+        book.title = data['title']
+        book.author = data['author']
+        book.isbn = data['isbn']
+        book.publisher = data.get('publisher')
+        book.year = data.get('year')
+        book.total_copies = data.get('total_copies', 1)
         book.available_copies = data.get('available_copies', book.total_copies)
         return book
 
@@ -53,10 +67,11 @@ class Book:
 class User:
     """Represents a user of the library."""
 
-    def __init__(self, username, password, name, email=None, role='member'):
-        self.id = str(uuid.uuid4())
+    def __init__(self, username, password, name, email=None, role='member', salt=None):
+        self.id = uuid.uuid4().hex
         self.username = username
-        self.password = password  # Note: In production, this should be hashed
+        self.password = password  # Password hash
+        self.salt = salt  # Hex-encoded KDF salt; None for legacy SHA-256 hashes
         self.name = name
         self.email = email
         self.role = role  # member, librarian, admin
@@ -71,6 +86,7 @@ class User:
             'id': self.id,
             'username': self.username,
             'password': self.password,
+            'salt': self.salt,
             'name': self.name,
             'email': self.email,
             'role': self.role,
@@ -80,15 +96,19 @@ class User:
     @classmethod
     def from_dict(cls, data):
         """Create a User instance from dictionary data."""
-        user = cls(
-            username=data['username'],
-            password=data['password'],
-            name=data['name'],
-            email=data.get('email'),
-            role=data.get('role', 'member')
-        )
+        # Bypass __init__ so no throwaway ID or timestamp is generated for stored records
+        user = cls.__new__(cls)
         user.id = data['id']
-        user.registered_date = data.get('registered_date', user.registered_date)
+        user.username = data['username']
+        user.password = data['password']
+        user.salt = data.get('salt')
+        user.name = data['name']
+        user.email = data.get('email')
+        user.role = data.get('role', 'member')
+        if 'registered_date' in data:
+            user.registered_date = data['registered_date']
+        else:
+            user.registered_date = datetime.now().strftime("%Y-%m-%d")
         return user
 
 
@@ -96,10 +116,11 @@ class Transaction:
     """Represents a book transaction (issue/return)."""
 
     def __init__(self, book_id, user_id, transaction_type='issue', days=14):
-        self.id = str(uuid.uuid4())
+        self.id = uuid.uuid4().hex
         self.book_id = book_id
         self.user_id = user_id
         self.transaction_type = transaction_type  # issue or return
+        # All transaction datetimes are naive local time; compare them against datetime.now()
         self.transaction_date = datetime.now()
         self.due_date = self.transaction_date + timedelta(days=days) if transaction_type == 'issue' else None
         self.return_date = None
@@ -115,16 +136,17 @@ class Transaction:
             transaction_info += f", Fine: ${self.fine:.2f}"
         return transaction_info
 
-    def is_overdue(self):
+    def is_overdue(self, now=None):
         """Check if a transaction is overdue."""
         if self.transaction_type == 'issue' and not self.return_date:
-            return datetime.now() > self.due_date
+            return (now or datetime.now()) > self.due_date
         return False
 
-    def calculate_fine(self, fine_per_day=0.50):
+    def calculate_fine(self, fine_per_day=0.50, now=None):
         """Calculate fine for overdue books."""
-        if self.is_overdue():
-            days_overdue = (datetime.now() - self.due_date).days
+        now = now or datetime.now()
+        if self.is_overdue(now):
+            days_overdue = (now - self.due_date).days
             self.fine = days_overdue * fine_per_day
         return self.fine
 
@@ -138,22 +160,23 @@ class Transaction:
             'transaction_date': self.transaction_date.strftime("%Y-%m-%d %H:%M:%S"),
             'due_date': self.due_date.strftime("%Y-%m-%d %H:%M:%S") if self.due_date else None,
             'return_date': self.return_date.strftime("%Y-%m-%d %H:%M:%S") if self.return_date else None,
+            'transaction_ts': _timestamp(self.transaction_date),
+            'due_ts': _timestamp(self.due_date),
+            'return_ts': _timestamp(self.return_date),
             'fine': self.fine
         }
 
     @classmethod
     def from_dict(cls, data):
         """Create a Transaction instance from dictionary data."""
-        transaction = cls(
-            book_id=data['book_id'],
-            user_id=data['user_id'],
-            transaction_type=data['transaction_type']
-        )
+        # Bypass __init__ so no throwaway ID or timestamps are generated for stored records
+        transaction = cls.__new__(cls)
         transaction.id = data['id']
-        transaction.transaction_date = datetime.strptime(data['transaction_date'], "%Y-%m-%d %H:%M:%S")
-        if data['due_date']:
-            transaction.due_date = datetime.strptime(data['due_date'], "%Y-%m-%d %H:%M:%S")
-        if data['return_date']:
-            transaction.return_date = datetime.strptime(data['return_date'], "%Y-%m-%d %H:%M:%S")
+        transaction.book_id = data['book_id']
+        transaction.user_id = data['user_id']
+        transaction.transaction_type = data['transaction_type']
+        transaction.transaction_date = _stored_datetime(data, 'transaction_date', 'transaction_ts')
+        transaction.due_date = _stored_datetime(data, 'due_date', 'due_ts')
+        transaction.return_date = _stored_datetime(data, 'return_date', 'return_ts')
         transaction.fine = data['fine']
         return transaction
@@ -2,6 +2,7 @@
 # Library Management System - Library Service
 
 from datetime import datetime
+from .data_handler import normalize_isbn
 from .models import Book, Transaction
 
 
@@ -19,20 +20,36 @@ class LibraryService:
         if not self.auth.is_librarian():
             return False, "Only librarians can add books."
 
+        message = self._add_book(title, author, isbn, publisher, year, copies)
+        self.data_handler.flush()
+        return True, message
+
+    def add_books_bulk(self, specs):
+        """Add several books, given as (title, author, isbn, publisher, year, copies) tuples, with a single save."""
+        if not self.auth.is_librarian():
+            return False, "Only librarians can add books."
+
+        for spec in specs:
+            self._add_book(*spec)
+        self.data_handler.flush()
+        return True, f"Added {len(specs)} books."
+
+    def _add_book(self, title, author, isbn, publisher=None, year=None, copies=1):
+        """Add a book or extra copies of it without saving, returning a status message."""
         # Check if book with same ISBN already exists
-        books = self.data_handler.search_books(isbn, 'isbn')
-        if books:
+        isbn = normalize_isbn(isbn)
+        book = self.data_handler.find_book_by_isbn(isbn)
+        if book:
             # If the book exists, increase the number of copies
-            book = books[0]
             book.total_copies += copies
             book.available_copies += copies
             self.data_handler.update_book(book)
-            return True, f"Added {copies} copies of existing book: {book.title}"
+            return f"Added {copies} copies of existing book: {book.title}"
 
         # Create and save a new book
         book = Book(title, author, isbn, publisher, year, copies)
         self.data_handler.add_book(book)
-        return True, f"Added new book: {title}"
+        return f"Added new book: {title}"
 
     def remove_book(self, book_id):
         """Remove a book from the library."""
@@ -44,19 +61,31 @@ class LibraryService:
         if not book:
             return False, "Book not found."
 
+        return self.remove_book_obj(book)
+
+    def remove_book_obj(self, book):
+        """Remove a book the caller has already loaded, skipping the lookup by ID."""
+        if not self.auth.is_librarian():
+            return False, "Only librarians can remove books."
+
         # Check if the book is currently issued
-        active_transactions = self.data_handler.get_book_transactions(book_id, active_only=True)
+        active_transactions = self.data_handler.get_book_transactions(book.id, active_only=True)
         if active_transactions:
             return False, "Cannot remove book that is currently issued."
 
         # Delete the book
-        self.data_handler.delete_book(book_id)
+        self.data_handler.delete_book(book.id)
+        self.data_handler.flush()
         return True, f"Book removed: {book.title}"
 
     def search_books(self, query, field=None):
         """Search for books by title, author, or ISBN."""
         return self.data_handler.search_books(query, field)
 
+    def search_books_prefix(self, prefix):
+        """Search for books whose title or author starts with prefix."""
+        return self.data_handler.search_books_prefix(prefix)
+
     def get_all_books(self):
         """Get all books in the library."""
         return self.data_handler.get_all_books()
@@ -72,24 +101,30 @@ class LibraryService:
         if not book:
             return False, "Book not found."
 
+        return self.issue_book_obj(book, days)
+
+    def issue_book_obj(self, book, days=14):
+        """Issue a book the caller has already loaded to the current user, skipping the lookup by ID."""
+        if not self.auth.is_authenticated():
+            return False, "You must be logged in to issue a book."
+
         # Check if the book is available
         if book.available_copies <= 0:
             return False, "No copies of this book are available."
 
         # Check if the user already has this book
         user_id = self.auth.current_user.id
-        active_transactions = self.data_handler.get_user_transactions(user_id, active_only=True)
-        for transaction in active_transactions:
-            if transaction.book_id == book_id:
-                return False, "You already have this book issued."
+        if self.data_handler.find_active_transaction(user_id, book.id):
+            return False, "You already have this book issued."
 
         # Issue the book
-        transaction = Transaction(book_id, user_id, transaction_type='issue', days=days)
+        transaction = Transaction(book.id, user_id, transaction_type='issue', days=days)
         self.data_handler.add_transaction(transaction)
 
         # Update book availability
         book.available_copies -= 1
         self.data_handler.update_book(book)
+        self.data_handler.flush()
 
         return True, f"Book issued: {book.title}"
 
@@ -105,21 +140,16 @@ class LibraryService:
 
         # Check if the user has this book issued
         user_id = self.auth.current_user.id
-        active_transactions = self.data_handler.get_user_transactions(user_id, active_only=True)
-        transaction = None
-        for t in active_transactions:
-            if t.book_id == book_id:
-                transaction = t
-                break
-
+        transaction = self.data_handler.find_active_transaction(user_id, book_id)
         if not transaction:
             return False, "You do not have this book issued."
 
         # Mark the transaction as returned
-        transaction.return_date = datetime.now()
+        now = datetime.now()
+        transaction.return_date = now
 
         # Calculate any fines
-        fine = transaction.calculate_fine()
+        fine = transaction.calculate_fine(now=now)
 
         # Update the transaction
         self.data_handler.update_transaction(transaction)
@@ -127,6 +157,7 @@ class LibraryService:
         # Update book availability
         book.available_copies += 1
         self.data_handler.update_book(book)
+        self.data_handler.flush()
 
         # Return with fine information if applicable
         if fine > 0:
@@ -134,12 +165,16 @@ class LibraryService:
         return True, f"Book returned: {book.title}"
 
     def get_user_books(self):
-        """Get all books currently issued to the current user."""
+        """Get all books currently issued to the current user.
+
+        Each book carries due_date, transaction_id, is_overdue and fine attributes.
+        """
         if not self.auth.is_authenticated():
             return [], "You must be logged in to view your books."
 
         user_id = self.auth.current_user.id
         active_transactions = self.data_handler.get_user_transactions(user_id, active_only=True)
+        now = datetime.now()
 
         books = []
         for transaction in active_transactions:
@@ -148,8 +183,8 @@ class LibraryService:
                 # Add transaction details to the book for display
                 book.due_date = transaction.due_date
                 book.transaction_id = transaction.id
-                book.is_overdue = transaction.is_overdue()
-                book.fine = transaction.calculate_fine()
+                book.is_overdue = transaction.is_overdue(now)
+                book.fine = transaction.calculate_fine(now=now)
                 books.append(book)
 
         return books, None
@@ -159,7 +194,8 @@ class LibraryService:
         if not self.auth.is_librarian():
             return [], "Only librarians can view overdue books."
 
-        overdue_transactions = self.data_handler.get_overdue_transactions()
+        now = datetime.now()
+        overdue_transactions = self.data_handler.get_overdue_transactions(now)
 
         overdue_items = []
         for transaction in overdue_transactions:
@@ -171,7 +207,8 @@ class LibraryService:
                     'transaction': transaction,
                     'book': book,
                     'user': user,
-                    'fine': transaction.calculate_fine()
+                    'days_late': (now - transaction.due_date).days,
+                    'fine': transaction.calculate_fine(now=now)
                 })
 
         return overdue_items, None
@@ -3,13 +3,61 @@
 
 import os
 import sys
-from datetime import datetime
 
 from .data_handler import DataHandler
-from .auth import Authentication
+from .auth import Authentication, LIBRARIAN_ROLES
 from .service import LibraryService
 from .models import Book, User, Transaction
 
+# Sample BCA curriculum books: (title, author, isbn, publisher, year, copies)
+_BCA_SEED = (
+    # Programming
+    ("Python Programming for Beginners", "John Smith", "978-1234567890", "Tech Publications", 2022, 3),
+    ("Introduction to Java Programming", "Daniel Liang", "978-0136520238", "Pearson", 2021, 2),
+    ("C Programming Language", "Brian Kernighan, Dennis Ritchie", "978-0131103627", "Prentice Hall", 1988, 5),
+    # Databases
+    ("Database Management Systems", "Raghu Ramakrishnan", "978-0072465631", "McGraw-Hill", 2002, 2),
+    ("SQL: The Complete Reference", "James Groff", "978-0071592550", "McGraw-Hill", 2010, 3),
+    # Data structures
+    ("Data Structures and Algorithms in Python", "Michael T. Goodrich", "978-1118290279", "Wiley", 2013, 2),
+    ("Introduction to Algorithms", "Thomas H. Cormen", "978-0262033848", "MIT Press", 2009, 3),
+    # Networking
+    ("Computer Networks", "Andrew S. Tanenbaum", "978-0132126953", "Pearson", 2010, 2),
+    # Software engineering
+    ("Software Engineering", "Ian Sommerville", "978-0137053469", "Pearson", 2015, 2),
+    # Web development
+    ("Web Development with Node and Express", "Ethan Brown", "978-1491949306", "O'Reilly Media", 2019, 2),
+    ("HTML and CSS: Design and Build Websites", "Jon Duckett", "978-1118008188", "Wiley", 2011, 3),
+    # Operating systems
+    ("Operating System Concepts", "Abraham Silberschatz", "978-1118063330", "Wiley", 2012, 2),
+    # Mathematics
+    ("Discrete Mathematics and Its Applications", "Kenneth Rosen", "978-0073383095", "McGraw-Hill", 2018, 2),
+    ("Calculus: Early Transcendentals", "James Stewart", "978-1285741550", "Cengage Learning", 2015, 2),
+    # Artificial intelligence
+    ("Artificial Intelligence: A Modern Approach", "Stuart Russell, Peter Norvig", "978-0136042594", "Pearson", 2020, 2),
+)
+
+# Table row layouts, bound once and reused for every row
+_BOOK_ROW_FMT = "{:<5} {:<30} {:<20} {:<15} {:<10}".format
+_OVERDUE_ROW_FMT = "{:<5} {:<25} {:<15} {:<15} {:<10} {:<10}".format
+
+# Separator lines, built once instead of on every screen render
+_SEP = "-" * 50
+_DSEP = "=" * 50
+_RULE = "-" * 80
+_TITLE_BAR = "\n" + _DSEP
+_SECTION_BAR = "\n" + _SEP
+
+
+def _trunc(text, limit):
+    """Truncate text longer than limit characters, marking the cut with '...'."""
+    return text[:limit] + '...' if len(text) > limit else text
+
+
+def _norm(text):
+    """Normalize a typed answer for case-insensitive comparison."""
+    return text.strip().lower()
+
 
 class LibrarySystem:
     """Main system class that integrates all components of the Library Management System."""
@@ -20,11 +68,45 @@ class LibrarySystem:
         self.auth = Authentication(self.data_handler)
         self.library_service = LibraryService(self.data_handler, self.auth)
 
-        # Create an admin user if none exists
-        self._create_admin_if_not_exists()
-
-        # Add sample BCA books if no books exist
-        self._add_bca_books_if_empty()
+        # Menu choice -> handler; exit and "back" are handled by the menu loops
+        self._menu_dispatch = {
+            '1': self._login,
+            '2': self._register,
+            '3': self._search_books,
+            '4': self._view_all_books,
+            '5': self._issue_book,
+            '6': self._return_book,
+            '7': self._view_my_books,
+            '8': self._librarian_menu,
+        }
+        self._librarian_dispatch = {
+            '1': self._add_book,
+            '2': self._remove_book,
+            '3': self._view_overdue_books,
+        }
+
+        # Static main menu text, joined once so each render is a single print
+        self._menu_header = "\n".join([_SECTION_BAR, "MAIN MENU".center(50), _SEP])
+        self._base_menu = "\n".join([
+            "1. Login",
+            "2. Register",
+            "3. Search Books",
+            "4. View All Books",
+            "5. Issue Book",
+            "6. Return Book",
+            "7. View My Books",
+        ])
+
+        # Bootstrap only once per data directory; the sentinel marks it as done
+        sentinel = os.path.join(data_dir, ".initialized")
+        if not os.path.exists(sentinel):
+            # Create an admin user if none exists
+            self._create_admin_if_not_exists()
+
+            # Add sample BCA books if no books exist
+            self._add_bca_books_if_empty()
+
+            open(sentinel, 'w').close()
 
     def _create_admin_if_not_exists(self):
         """Create an admin user if no users exist in the system."""
@@ -36,33 +118,20 @@ class LibrarySystem:
 
     def start(self):
         """Start the Library Management System."""
-        print("\n" + "="*50)
+        print(_TITLE_BAR)
         print("Welcome to the Library Management System".center(50))
-        print("="*50 + "\n")
+        print(_DSEP + "\n")
 
         while True:
             self._display_menu()
             choice = input("\nEnter your choice (1-9): ").strip()
 
-            if choice == '1':
-                self._login()
-            elif choice == '2':
-                self._register()
-            elif choice == '3':
-                self._search_books()
-            elif choice == '4':
-                self._view_all_books()
-            elif choice == '5':
-                self._issue_book()
-            elif choice == '6':
-                self._return_book()
-            elif choice == '7':
-                self._view_my_books()
-            elif choice == '8':
-                self._librarian_menu()
+            handler = self._menu_dispatch.get(choice)
+            if handler:
+                handler()
             elif choice == '9':
                 print("\nThank you for using the Library Management System. Goodbye!")
-                sys.exit(0)
+                return
             else:
                 print("\nInvalid choice. Please try again.")
 
@@ -70,40 +139,30 @@ class LibrarySystem:
 
     def _display_menu(self):
         """Display the main menu of the system."""
-        print("\n" + "-"*50)
-        print("MAIN MENU".center(50))
-        print("-"*50)
-
-        if self.auth.is_authenticated():
-            print(f"Logged in as: {self.auth.current_user.name} ({self.auth.current_user.role})")
-            print("-"*50)
-
-        print("1. Login")
-        print("2. Register")
-        print("3. Search Books")
-        print("4. View All Books")
-        print("5. Issue Book")
-        print("6. Return Book")
-        print("7. View My Books")
-
-        if self.auth.is_librarian():
-            print("8. Librarian Menu")
-
-        print("9. Exit")
+        user = self.auth.current_user
+        parts = [self._menu_header]
+        if user is not None:
+            parts.append(f"Logged in as: {user.name} ({user.role})\n{_SEP}")
+        parts.append(self._base_menu)
+        if user is not None and user.role in LIBRARIAN_ROLES:
+            parts.append("8. Librarian Menu")
+        parts.append("9. Exit")
+        print("\n".join(parts))
 
     def _login(self):
         """Handle user login."""
-        if self.auth.is_authenticated():
-            print(f"\nYou are already logged in as {self.auth.current_user.name}.")
-            choice = input("Would you like to logout? (y/n): ").strip().lower()
+        user = self.auth.current_user
+        if user is not None:
+            print(f"\nYou are already logged in as {user.name}.")
+            choice = _norm(input("Would you like to logout? (y/n): "))
             if choice == 'y':
                 success, message = self.auth.logout()
                 print(f"\n{message}")
             return
 
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("LOGIN".center(50))
-        print("-"*50)
+        print(_SEP)
 
         username = input("Username: ").strip()
         password = input("Password: ").strip()
@@ -113,23 +172,35 @@ class LibrarySystem:
 
     def _register(self):
         """Handle user registration."""
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("REGISTER".center(50))
-        print("-"*50)
+        print(_SEP)
 
-        username = input("Username: ").strip()
-        password = input("Password: ").strip()
-        name = input("Full Name: ").strip()
-        email = input("Email (optional): ").strip() or None
+        username, password, name, email = self._prompt_many(
+            ["Username: ", "Password: ", "Full Name: ", "Email (optional): "])
+        email = email or None
 
         success, message = self.auth.register_user(username, password, name, email)
         print(f"\n{message}")
 
+    def _prompt_many(self, prompts):
+        """Prompt for several values in a row, returning the stripped answers."""
+        # Write prompts and read lines directly rather than paying input()'s overhead per field
+        answers = []
+        for prompt in prompts:
+            sys.stdout.write(prompt)
+            sys.stdout.flush()
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            answers.append(line.strip())
+        return answers
+
     def _search_books(self):
         """Handle book search."""
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("SEARCH BOOKS".center(50))
-        print("-"*50)
+        print(_SEP)
 
         query = input("Enter search term: ").strip()
         if not query:
@@ -142,41 +213,54 @@ class LibrarySystem:
 
     def _view_all_books(self):
         """Display all books in the library."""
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("ALL BOOKS".center(50))
-        print("-"*50)
+        print(_SEP)
 
         books = self.library_service.get_all_books()
         self._display_books(books)
 
-    def _display_books(self, books):
-        """Display a list of books."""
+    def _display_books(self, books, page_size=25):
+        """Display a list of books, a page at a time when there are more than page_size."""
         if not books:
             print("\nNo books found.")
             return
 
-        print("\n{:<5} {:<30} {:<20} {:<15} {:<10}".format(
-            "ID", "Title", "Author", "ISBN", "Available"))
-        print("-"*80)
-
-        for i, book in enumerate(books, 1):
-            print("{:<5} {:<30} {:<20} {:<15} {:<10}".format(
+        offset = 0
+        while True:
+            # Build the page and write it in one call; IDs stay numbered across pages
+            lines = ["\n" + _BOOK_ROW_FMT("ID", "Title", "Author", "ISBN", "Available"), _RULE]
+            lines.extend(_BOOK_ROW_FMT(
                 i,
-                (book.title[:27] + '...') if len(book.title) > 27 else book.title,
-                (book.author[:17] + '...') if len(book.author) > 17 else book.author,
+                _trunc(book.title, 27),
+                _trunc(book.author, 17),
                 book.isbn,
                 f"{book.available_copies}/{book.total_copies}"
-            ))
+            ) for i, book in enumerate(books[offset:offset + page_size], offset + 1))
+            sys.stdout.write("\n".join(lines) + "\n")
+
+            if len(books) <= page_size:
+                return
+
+            last_page = (len(books) - 1) // page_size * page_size
+            print(f"\nShowing {offset + 1}-{min(offset + page_size, len(books))} of {len(books)} books.")
+            action = _norm(input("[n]ext/[p]rev/[q]uit: "))
+            if action == 'n':
+                offset = min(offset + page_size, last_page)
+            elif action == 'p':
+                offset = max(offset - page_size, 0)
+            elif action == 'q':
+                return
 
     def _issue_book(self):
         """Handle issuing a book to the current user."""
-        if not self.auth.is_authenticated():
+        if self.auth.current_user is None:
             print("\nYou must be logged in to issue a book.")
             return
 
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("ISSUE BOOK".center(50))
-        print("-"*50)
+        print(_SEP)
 
         # Show all books or search for books
         choice = input("Do you want to (1) View all books or (2) Search for a book? (1/2): ").strip()
@@ -202,7 +286,7 @@ class LibrarySystem:
                 return
 
             book = books[book_index]
-            success, message = self.library_service.issue_book(book.id)
+            success, message = self.library_service.issue_book_obj(book)
             print(f"\n{message}")
 
         except ValueError:
@@ -210,13 +294,13 @@ class LibrarySystem:
 
     def _return_book(self):
         """Handle returning a book."""
-        if not self.auth.is_authenticated():
+        if self.auth.current_user is None:
             print("\nYou must be logged in to return a book.")
             return
 
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("RETURN BOOK".center(50))
-        print("-"*50)
+        print(_SEP)
 
         books, error = self.library_service.get_user_books()
 
@@ -228,22 +312,19 @@ class LibrarySystem:
             print("\nYou don't have any books issued.")
             return
 
-        print("\nYour issued books:")
-        print("\n{:<5} {:<30} {:<20} {:<15} {:<10}".format(
-            "ID", "Title", "Author", "Due Date", "Fine"))
-        print("-"*80)
-
+        lines = ["\nYour issued books:", "\n" + _BOOK_ROW_FMT("ID", "Title", "Author", "Due Date", "Fine"), _RULE]
         for i, book in enumerate(books, 1):
-            due_date_str = book.due_date.strftime("%Y-%m-%d") if hasattr(book, 'due_date') else "N/A"
-            fine_str = f"${book.fine:.2f}" if hasattr(book, 'fine') and book.fine > 0 else "None"
+            due_date_str = book.due_date.strftime("%Y-%m-%d") if book.due_date else "N/A"
+            fine_str = f"${book.fine:.2f}" if book.fine > 0 else "None"
 
-            print("{:<5} {:<30} {:<20} {:<15} {:<10}".format(
+            lines.append(_BOOK_ROW_FMT(
                 i,
-                (book.title[:27] + '...') if len(book.title) > 27 else book.title,
-                (book.author[:17] + '...') if len(book.author) > 17 else book.author,
+                _trunc(book.title, 27),
+                _trunc(book.author, 17),
                 due_date_str,
                 fine_str
             ))
+        sys.stdout.write("\n".join(lines) + "\n")
 
         try:
             book_index = int(input("\nEnter the ID of the book you want to return: ").strip()) - 1
@@ -260,13 +341,13 @@ class LibrarySystem:
 
     def _view_my_books(self):
         """Display books issued to the current user."""
-        if not self.auth.is_authenticated():
+        if self.auth.current_user is None:
             print("\nYou must be logged in to view your books.")
             return
 
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("MY BOOKS".center(50))
-        print("-"*50)
+        print(_SEP)
 
         books, error = self.library_service.get_user_books()
 
@@ -278,32 +359,31 @@ class LibrarySystem:
             print("\nYou don't have any books issued.")
             return
 
-        print("\n{:<5} {:<30} {:<20} {:<15} {:<10}".format(
-            "ID", "Title", "Author", "Due Date", "Status"))
-        print("-"*80)
-
+        lines = ["\n" + _BOOK_ROW_FMT("ID", "Title", "Author", "Due Date", "Status"), _RULE]
         for i, book in enumerate(books, 1):
-            due_date_str = book.due_date.strftime("%Y-%m-%d") if hasattr(book, 'due_date') else "N/A"
-            status = "Overdue" if hasattr(book, 'is_overdue') and book.is_overdue else "Active"
+            due_date_str = book.due_date.strftime("%Y-%m-%d") if book.due_date else "N/A"
+            status = "Overdue" if book.is_overdue else "Active"
 
-            print("{:<5} {:<30} {:<20} {:<15} {:<10}".format(
+            lines.append(_BOOK_ROW_FMT(
                 i,
-                (book.title[:27] + '...') if len(book.title) > 27 else book.title,
-                (book.author[:17] + '...') if len(book.author) > 17 else book.author,
+                _trunc(book.title, 27),
+                _trunc(book.author, 17),
                 due_date_str,
                 status
             ))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _librarian_menu(self):
         """Display and handle the librarian menu."""
-        if not self.auth.is_librarian():
+        user = self.auth.current_user
+        if user is None or user.role not in LIBRARIAN_ROLES:
             print("\nAccess denied. Only librarians can access this menu.")
             return
 
         while True:
-            print("\n" + "-"*50)
+            print(_SECTION_BAR)
             print("LIBRARIAN MENU".center(50))
-            print("-"*50)
+            print(_SEP)
             print("1. Add Book")
             print("2. Remove Book")
             print("3. View Overdue Books")
@@ -311,12 +391,9 @@ class LibrarySystem:
 
             choice = input("\nEnter your choice (1-4): ").strip()
 
-            if choice == '1':
-                self._add_book()
-            elif choice == '2':
-                self._remove_book()
-            elif choice == '3':
-                self._view_overdue_books()
+            handler = self._librarian_dispatch.get(choice)
+            if handler:
+                handler()
             elif choice == '4':
                 break
             else:
@@ -326,24 +403,22 @@ class LibrarySystem:
 
     def _add_book(self):
         """Handle adding a new book."""
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("ADD BOOK".center(50))
-        print("-"*50)
+        print(_SEP)
 
-        title = input("Title: ").strip()
-        author = input("Author: ").strip()
-        isbn = input("ISBN: ").strip()
-        publisher = input("Publisher (optional): ").strip() or None
+        title, author, isbn, publisher, year, copies = self._prompt_many(
+            ["Title: ", "Author: ", "ISBN: ", "Publisher (optional): ",
+             "Year (optional): ", "Number of copies (default: 1): "])
+        publisher = publisher or None
 
         try:
-            year = input("Year (optional): ").strip()
             year = int(year) if year else None
         except ValueError:
             print("\nInvalid year. Using None.")
             year = None
 
         try:
-            copies = input("Number of copies (default: 1): ").strip()
             copies = int(copies) if copies else 1
             if copies < 1:
                 copies = 1
@@ -360,9 +435,9 @@ class LibrarySystem:
 
     def _remove_book(self):
         """Handle removing a book."""
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("REMOVE BOOK".center(50))
-        print("-"*50)
+        print(_SEP)
 
         # Show all books or search for books
         choice = input("Do you want to (1) View all books or (2) Search for a book? (1/2): ").strip()
@@ -389,12 +464,12 @@ class LibrarySystem:
 
             book = books[book_index]
 
-            confirm = input(f"\nAre you sure you want to remove '{book.title}'? (y/n): ").strip().lower()
+            confirm = _norm(input(f"\nAre you sure you want to remove '{book.title}'? (y/n): "))
             if confirm != 'y':
                 print("\nBook removal cancelled.")
                 return
 
-            success, message = self.library_service.remove_book(book.id)
+            success, message = self.library_service.remove_book_obj(book)
             print(f"\n{message}")
 
         except ValueError:
@@ -402,9 +477,9 @@ class LibrarySystem:
 
     def _view_overdue_books(self):
         """Display all overdue books."""
-        print("\n" + "-"*50)
+        print(_SECTION_BAR)
         print("OVERDUE BOOKS".center(50))
-        print("-"*50)
+        print(_SEP)
 
         overdue_items, error = self.library_service.get_overdue_books()
 
@@ -416,27 +491,25 @@ class LibrarySystem:
             print("\nNo overdue books found.")
             return
 
-        print("\n{:<5} {:<25} {:<15} {:<15} {:<10} {:<10}".format(
-            "ID", "Book Title", "User", "Due Date", "Days Late", "Fine"))
-        print("-"*80)
-
+        lines = ["\n" + _OVERDUE_ROW_FMT("ID", "Book Title", "User", "Due Date", "Days Late", "Fine"), _RULE]
         for i, item in enumerate(overdue_items, 1):
             book = item['book']
             user = item['user']
             transaction = item['transaction']
             fine = item['fine']
+            days_late = item['days_late']
 
             due_date = transaction.due_date
-            days_late = (datetime.now() - due_date).days
 
-            print("{:<5} {:<25} {:<15} {:<15} {:<10} {:<10}".format(
+            lines.append(_OVERDUE_ROW_FMT(
                 i,
-                (book.title[:22] + '...') if len(book.title) > 22 else book.title,
-                (user.name[:12] + '...') if len(user.name) > 12 else user.name,
+                _trunc(book.title, 22),
+                _trunc(user.name, 12),
                 due_date.strftime("%Y-%m-%d"),
                 days_late,
                 f"${fine:.2f}"
             ))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _add_bca_books_if_empty(self):
         """Add sample BCA books if the library is empty."""
@@ -445,154 +518,12 @@ class LibrarySystem:
             print("Adding sample BCA books to the library...")
 
             # Create a temporary admin login to add books
-            current_user = self.auth.current_user
+            previous_user = self.auth.current_user
             admin_user = self.data_handler.find_user_by_username("admin")
             self.auth.current_user = admin_user
 
-            # Add BCA programming books
-            self.library_service.add_book(
-                "Python Programming for Beginners",
-                "John Smith",
-                "978-1234567890",
-                "Tech Publications",
-                2022,
-                3
-            )
-
-            self.library_service.add_book(
-                "Introduction to Java Programming",
-                "Daniel Liang",
-                "978-0136520238",
-                "Pearson",
-                2021,
-                2
-            )
-
-            self.library_service.add_book(
-                "C Programming Language",
-                "Brian Kernighan, Dennis Ritchie",
-                "978-0131103627",
-                "Prentice Hall",
-                1988,
-                5
-            )
-
-            # Add BCA database books
-            self.library_service.add_book(
-                "Database Management Systems",
-                "Raghu Ramakrishnan",
-                "978-0072465631",
-                "McGraw-Hill",
-                2002,
-                2
-            )
-
-            self.library_service.add_book(
-                "SQL: The Complete Reference",
-                "James Groff",
-                "978-0071592550",
-                "McGraw-Hill",
-                2010,
-                3
-            )
-
-            # Add BCA data structures books
-            self.library_service.add_book(
-                "Data Structures and Algorithms in Python",
-                "Michael T. Goodrich",
-                "978-1118290279",
-                "Wiley",
-                2013,
-                2
-            )
-
-            self.library_service.add_book(
-                "Introduction to Algorithms",
-                "Thomas H. Cormen",
-                "978-0262033848",
-                "MIT Press",
-                2009,
-                3
-            )
-
-            # Add BCA networking books
-            self.library_service.add_book(
-                "Computer Networks",
-                "Andrew S. Tanenbaum",
-                "978-0132126953",
-                "Pearson",
-                2010,
-                2
-            )
-
-            # Add BCA software engineering books
-            self.library_service.add_book(
-                "Software Engineering",
-                "Ian Sommerville",
-                "978-0137053469",
-                "Pearson",
-                2015,
-                2
-            )
-
-            # Add BCA web development books
-            self.library_service.add_book(
-                "Web Development with Node and Express",
-                "Ethan Brown",
-                "978-1491949306",
-                "O'Reilly Media",
-                2019,
-                2
-            )
-
-            self.library_service.add_book(
-                "HTML and CSS: Design and Build Websites",
-                "Jon Duckett",
-                "978-1118008188",
-                "Wiley",
-                2011,
-                3
-            )
-
-            # Add BCA operating system books
-            self.library_service.add_book(
-                "Operating System Concepts",
-                "Abraham Silberschatz",
-                "978-1118063330",
-                "Wiley",
-                2012,
-                2
-            )
-
-            # Add BCA mathematics books
-            self.library_service.add_book(
-                "Discrete Mathematics and Its Applications",
-                "Kenneth Rosen",
-                "978-0073383095",
-                "McGraw-Hill",
-                2018,
-                2
-            )
-
-            self.library_service.add_book(
-                "Calculus: Early Transcendentals",
-                "James Stewart",
-                "978-1285741550",
-                "Cengage Learning",
-                2015,
-                2
-            )
-
-            # Add BCA artificial intelligence books
-            self.library_service.add_book(
-                "Artificial Intelligence: A Modern Approach",
-                "Stuart Russell, Peter Norvig",
-                "978-0136042594",
-                "Pearson",
-                2020,
-                2
-            )
+            self.library_service.add_books_bulk(_BCA_SEED)
 
             # Restore original user
-            self.auth.current_user = current_user
+            self.auth.current_user = previous_user
             print("Sample BCA books added successfully!")
@@ -7,6 +7,8 @@ def main():
     """Main entry point for the Library Management System"""
     library_system = LibrarySystem()
     library_system.start()
+    # Persist anything still pending before the process exits
+    library_system.data_handler.flush()
 
 if __name__ == "__main__":
     main()